@@ -12,7 +12,9 @@ Usage:
 """
 
 import argparse
+import csv
 import json
+import os
 import sys
 from collections import Counter
 from pathlib import Path
@@ -24,18 +26,37 @@ BASE_DIR = Path(__file__).parent
 # Data loading
 # ---------------------------------------------------------------------------
 
+def metadata_paths(directory: Path) -> list[Path]:
+    """
+    Sorted <accession>/metadata.json paths under one form directory (8K/ or
+    10K/). Folders starting with "_" hold datamule's _tmp_* portfolios rather
+    than saved filings, so they are left out.
+    """
+    with os.scandir(directory) as it:
+        return sorted(
+            Path(entry.path) / "metadata.json"
+            for entry in it
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("_")
+        )
+
+
 def load_all(base: Path) -> list[dict]:
     records = []
     for form in ("8K", "10K"):
         d = base / form
         if not d.exists():
             continue
-        for meta_path in sorted(d.rglob("metadata.json")):
+        for meta_path in metadata_paths(d):
             try:
                 r = json.loads(meta_path.read_text(encoding="utf-8"))
-                cyber_path = meta_path.parent / "cybersecurity.md"
-                r["text_length"] = len(cyber_path.read_text(encoding="utf-8")) if cyber_path.exists() else 0
+                try:
+                    cyber_text = (meta_path.parent / "cybersecurity.md").read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    cyber_text = ""
+                r["text_length"] = len(cyber_text)
                 records.append(r)
+            except FileNotFoundError:
+                continue  # folder without metadata.json (interrupted save)
             except Exception as e:
                 print(f"[WARN] Could not read {meta_path}: {e}", file=sys.stderr)
     return records
@@ -81,10 +102,11 @@ def print_report(records: list[dict]):
     # Top filers
     print("\nTop 15 most active filers (by disclosure count):")
     ticker_counts: Counter = Counter(r.get("ticker", "?") for r in records)
+    company_by_ticker: dict[str, str] = {}
+    for r in records:
+        company_by_ticker.setdefault(r.get("ticker"), r.get("company_name", ""))
     for ticker, count in top_n(ticker_counts, 15):
-        company = next(
-            (r.get("company_name", "") for r in records if r.get("ticker") == ticker), ""
-        )
+        company = company_by_ticker.get(ticker, "")
         print(f"  {ticker:10s}  {count:4d}  {company}")
 
     # Monthly trend (last 24 months)
@@ -113,21 +135,16 @@ def print_report(records: list[dict]):
 
 
 def export_csv(records: list[dict], path: str):
-    try:
-        import csv
-
-        fieldnames = [
-            "accession_number", "ticker", "cik", "company_name",
-            "filing_date", "form_type", "item", "filing_url",
-            "retrieved_at", "text_length",
-        ]
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(records)
-        print(f"Exported {len(records):,} records → {path}")
-    except ImportError:
-        print("[ERROR] csv module not available", file=sys.stderr)
+    fieldnames = [
+        "accession_number", "ticker", "cik", "company_name",
+        "filing_date", "form_type", "item", "filing_url",
+        "retrieved_at", "text_length",
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+    print(f"Exported {len(records):,} records → {path}")
 
 
 # ---------------------------------------------------------------------------
@@ -147,15 +164,13 @@ def main():
         sys.exit(0)
 
     if args.json:
-        from collections import Counter as C
-
         output = {
             "total": len(records),
             "8K_material": sum(1 for r in records if r.get("form_type") == "8-K" and r.get("item") == "1.05"),
             "8K_voluntary": sum(1 for r in records if r.get("form_type") == "8-K" and r.get("item") == "8.01"),
             "10K": sum(1 for r in records if r.get("form_type") == "10-K"),
             "monthly": monthly_counts(records),
-            "top_tickers": dict(C(r.get("ticker", "?") for r in records).most_common(25)),
+            "top_tickers": dict(Counter(r.get("ticker", "?") for r in records).most_common(25)),
         }
         print(json.dumps(output, indent=2))
     else:
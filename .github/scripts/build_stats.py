@@ -11,7 +11,9 @@ Produces:
   - Counts of incident vs voluntary 8-K filings
 """
 
+import heapq
 import json
+import os
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -20,9 +22,23 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 OUTPUT_PATH = BASE_DIR / "stats" / "summary.json"
 
 
+def metadata_paths(directory: Path) -> list[Path]:
+    """
+    Return the sorted metadata.json paths of the accession folders directly
+    under directory. Names starting with "_" are skipped: those are datamule's
+    _tmp_8k/_tmp_10k download portfolios, not saved filings.
+    """
+    with os.scandir(directory) as it:
+        return sorted(
+            Path(entry.path) / "metadata.json"
+            for entry in it
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("_")
+        )
+
+
 def collect_metadata(directory: Path) -> list[dict]:
     records = []
-    for meta_path in sorted(directory.rglob("metadata.json")):
+    for meta_path in metadata_paths(directory):
         try:
             records.append(json.loads(meta_path.read_text(encoding="utf-8")))
         except Exception:
@@ -38,25 +54,23 @@ def build_summary(records_8k: list[dict], records_10k: list[dict]) -> dict:
         f"{r['form_type']} Item {r.get('item', '?')}" for r in all_records
     )
 
-    # 8-K breakdown: material (1.05) vs voluntary (8.01)
-    k8_material = sum(1 for r in records_8k if r.get("item") == "1.05")
-    k8_voluntary = sum(1 for r in records_8k if r.get("item") == "8.01")
+    # 8-K breakdown: material (1.05) vs voluntary (8.01), counted in one pass
+    k8_items = Counter(r.get("item") for r in records_8k)
+    k8_material = k8_items["1.05"]
+    k8_voluntary = k8_items["8.01"]
 
-    # --- Monthly trend ---
+    # --- Monthly and yearly trend (single pass) ---
     monthly: dict[str, dict] = defaultdict(lambda: {"8-K": 0, "10-K": 0})
-    for r in all_records:
-        date_str = r.get("filing_date", "")
-        if len(date_str) >= 7:
-            ym = date_str[:7]
-            monthly[ym][r.get("form_type", "?")] += 1
-    monthly_sorted = dict(sorted(monthly.items()))
-
-    # --- Yearly trend ---
     yearly: dict[str, dict] = defaultdict(lambda: {"8-K": 0, "10-K": 0})
     for r in all_records:
-        year = (r.get("filing_date") or "")[:4]
+        date_str = r.get("filing_date") or ""
+        form_type = r.get("form_type", "?")
+        if len(date_str) >= 7:
+            monthly[date_str[:7]][form_type] += 1
+        year = date_str[:4]
         if year.isdigit():
-            yearly[year][r.get("form_type", "?")] += 1
+            yearly[year][form_type] += 1
+    monthly_sorted = dict(sorted(monthly.items()))
     yearly_sorted = dict(sorted(yearly.items()))
 
     # --- Top companies (by total disclosures) ---
@@ -73,8 +87,8 @@ def build_summary(records_8k: list[dict], records_10k: list[dict]) -> dict:
     def sort_key(r):
         return r.get("filing_date") or ""
 
-    recent_8k = sorted(records_8k, key=sort_key, reverse=True)[:20]
-    recent_10k = sorted(records_10k, key=sort_key, reverse=True)[:20]
+    recent_8k = heapq.nlargest(20, records_8k, key=sort_key)
+    recent_10k = heapq.nlargest(20, records_10k, key=sort_key)
 
     def slim(r: dict) -> dict:
         return {
@@ -53,15 +53,26 @@ ITEM_1C_TITLES = [
     "item 1c. cybersecurity",
 ]
 
+# Lower-case patterns, run against full_text.lower() (much faster than re.I).
+# Each one needs "cyber", the word every Item 1C heading carries.
 CYBER_CONTENT_PATTERNS = [
-    re.compile(r"item\s*1c", re.I),
-    re.compile(r"cybersecurity\s+risk\s+management", re.I),
-    re.compile(r"cybersecurity\s+strategy", re.I),
-    re.compile(r"cybersecurity\s+governance", re.I),
-    re.compile(r"material\s+effect.*cyber", re.I),
-    re.compile(r"cyber.*board.*oversight", re.I),
+    re.compile(r"item\s*1c[.\s]*cybersecurity"),
+    re.compile(r"cybersecurity\s+risk\s+management"),
+    re.compile(r"cybersecurity\s+strategy"),
+    re.compile(r"cybersecurity\s+governance"),
+    re.compile(r"material\s+effect.*cyber"),
+    # cyber.*board.*oversight, anchored per line with atomic groups (3.11+) so
+    # a long line is scanned once instead of backtracking cubically over it
+    re.compile(r"^(?>[^\n]*?cyber)(?>[^\n]*?board)[^\n]*?oversight", re.M),
 ]
 
+# Slices "Item 1C. Cybersecurity ..." up to the next Item 1x/2x heading. Keeps
+# re.I and runs on the original text: lower() is not length-preserving for
+# every code point (U+0130), so offsets into the lowered copy can drift.
+ITEM_1C_SECTION_PATTERN = re.compile(
+    r"(item\s*1c[.\s]*cybersecurity.*?)(?=item\s*[12]\w?\b|\Z)", re.I | re.S
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -71,7 +82,7 @@ def get_start_date() -> str:
     if STATE_FILE.exists():
         last = STATE_FILE.read_text().strip()
         try:
-            dt = datetime.strptime(last, "%Y-%m-%d").date() + timedelta(days=1)
+            dt = date.fromisoformat(last) + timedelta(days=1)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             pass
@@ -85,8 +96,19 @@ def save_state(run_date: str):
 
 
 def accession_exists(accession: str) -> bool:
-    folder = OUTPUT_DIR / accession.replace("-", "")
-    return folder.exists() and (folder / "metadata.json").exists()
+    return (OUTPUT_DIR / accession.replace("-", "") / "metadata.json").exists()
+
+
+def raw_content_mentions_cyber(document) -> bool:
+    """
+    Whether the unparsed 10-K contains "cyber" anywhere (every Item 1C heading
+    reads "Cybersecurity"). Returns True when datamule exposes no raw content.
+    """
+    content = getattr(document, "content", None)
+    if not content:
+        return True
+    needle = b"cyber" if isinstance(content, (bytes, bytearray)) else "cyber"
+    return needle in content.lower()
 
 
 def extract_item_1c(document) -> str | None:
@@ -95,13 +117,19 @@ def extract_item_1c(document) -> str | None:
     Falls back to full text if the section extractor can't isolate it.
     Returns markdown or None.
     """
+    # get_section and .markdown both parse the whole filing; skip that work
+    # when the raw content never mentions cyber. ("1c" is no use here: raw
+    # HTML is full of it in hex colours and element ids.)
+    if not raw_content_mentions_cyber(document):
+        return None
+
     # Try direct section extraction
     for title in ITEM_1C_TITLES:
         try:
             section = document.get_section(title=title, title_class="item", format="markdown")
             if section:
                 text = section[0] if isinstance(section, list) else section
-                if text and len(text.strip()) > 100:
+                if text and len(text.strip()) > 100 and "cyber" in text.lower():
                     return text.strip()
         except Exception:
             pass
@@ -115,13 +143,15 @@ def extract_item_1c(document) -> str | None:
     if not full_text:
         return None
 
-    if any(p.search(full_text) for p in CYBER_CONTENT_PATTERNS):
+    # Every CYBER_CONTENT_PATTERNS entry needs "cyber" verbatim, so a substring
+    # test rejects unrelated text before any regex runs over it
+    lower = full_text.lower()
+    if "cyber" not in lower:
+        return None
+
+    if any(p.search(lower) for p in CYBER_CONTENT_PATTERNS):
         # Try to slice out just the cybersecurity portion via regex
-        cyber_match = re.search(
-            r"(item\s*1c[.\s]*cybersecurity.*?)(?=item\s*[12]\w?\b|\Z)",
-            full_text,
-            re.I | re.S,
-        )
+        cyber_match = ITEM_1C_SECTION_PATTERN.search(full_text)
         if cyber_match:
             extracted = cyber_match.group(1).strip()
             if len(extracted) > 100:
@@ -155,10 +185,13 @@ def build_metadata(sub, document) -> dict:
 def save_filing(accession: str, metadata: dict, cyber_text: str):
     folder = OUTPUT_DIR / accession.replace("-", "")
     folder.mkdir(parents=True, exist_ok=True)
-    (folder / "metadata.json").write_text(
+    (folder / "cybersecurity.md").write_text(cyber_text, encoding="utf-8")
+    # write metadata.json last and atomically: it is the accession_exists marker
+    tmp_path = folder / "metadata.json.tmp"
+    tmp_path.write_text(
         json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8"
     )
-    (folder / "cybersecurity.md").write_text(cyber_text, encoding="utf-8")
+    os.replace(tmp_path, folder / "metadata.json")
     print(f"  ✓ Saved {accession}  [{metadata.get('ticker','?')}]  {metadata.get('filing_date','')}")
 
 
@@ -39,20 +39,32 @@ FORM_TYPE = "8-K"
 # How many days back to look on the very first run (before STATE_FILE exists)
 DEFAULT_LOOKBACK_DAYS = 365 * 2  # capture full history since rule adoption
 
-# Regex patterns to identify cybersecurity sections
+# Regex patterns to identify cybersecurity sections. They are lower-case and
+# run against text.lower(): one lower() up front plus case-sensitive searches
+# is several times faster than re.I over a whole filing.
 CYBER_ITEM_PATTERNS = [
-    re.compile(r"item\s*1[\.\s]*05", re.I),     # Item 1.05
-    re.compile(r"cybersecurity\s+incident", re.I),
-    re.compile(r"material\s+cybersecurity", re.I),
+    re.compile(r"item\s*1[\.\s]*05"),     # Item 1.05
+    re.compile(r"cybersecurity\s+incident"),
+    re.compile(r"material\s+cybersecurity"),
 ]
 
 ITEM_801_CYBER_PATTERNS = [
-    re.compile(r"cybersecurity", re.I),
-    re.compile(r"cyber\s+incident", re.I),
-    re.compile(r"data\s+breach", re.I),
-    re.compile(r"ransomware", re.I),
+    re.compile(r"cybersecurity"),
+    re.compile(r"cyber\s+incident"),
+    re.compile(r"data\s+breach"),
+    re.compile(r"ransomware"),
 ]
 
+ALL_CYBER_PATTERNS = CYBER_ITEM_PATTERNS + ITEM_801_CYBER_PATTERNS
+
+# Substrings a kept 8-K must contain, checked on the raw filing before datamule
+# parses it and again on the parsed text. Each 8.01 pattern needs one of them,
+# and Item 1.05 is covered through its mandated title, "Material Cybersecurity
+# Incidents". A bare "Item 1.05"/"Item 105" reference with no cyber, breach or
+# ransomware wording anywhere is deliberately given up.
+RAW_CYBER_NEEDLES = ("cyber", "breach", "ransomware")
+RAW_CYBER_NEEDLES_BYTES = tuple(n.encode() for n in RAW_CYBER_NEEDLES)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -63,7 +75,7 @@ def get_start_date() -> str:
     if STATE_FILE.exists():
         last = STATE_FILE.read_text().strip()
         try:
-            dt = datetime.strptime(last, "%Y-%m-%d").date() + timedelta(days=1)
+            dt = date.fromisoformat(last) + timedelta(days=1)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             pass
@@ -80,8 +92,20 @@ def save_state(run_date: str):
 
 
 def accession_exists(accession: str) -> bool:
-    folder = OUTPUT_DIR / accession.replace("-", "")
-    return folder.exists() and (folder / "metadata.json").exists()
+    return (OUTPUT_DIR / accession.replace("-", "") / "metadata.json").exists()
+
+
+def raw_content_has_cyber_terms(document) -> bool:
+    """
+    Check the unparsed filing for any RAW_CYBER_NEEDLES term. datamule hands
+    over bytes or str; returns True when it exposes no raw content at all.
+    """
+    content = getattr(document, "content", None)
+    if not content:
+        return True
+    needles = RAW_CYBER_NEEDLES_BYTES if isinstance(content, (bytes, bytearray)) else RAW_CYBER_NEEDLES
+    lower = content.lower()
+    return any(n in lower for n in needles)
 
 
 def extract_cyber_section(document) -> str | None:
@@ -89,6 +113,10 @@ def extract_cyber_section(document) -> str | None:
     Extract the cybersecurity-relevant text from an 8-K document.
     Returns markdown string or None if no cyber content found.
     """
+    # Parsing to markdown is the expensive step, so reject unrelated filings first
+    if not raw_content_has_cyber_terms(document):
+        return None
+
     try:
         text = document.markdown or document.text or ""
     except Exception:
@@ -98,8 +126,10 @@ def extract_cyber_section(document) -> str | None:
         return None
 
     # Check if this document contains cyber content
-    has_cyber = any(p.search(text) for p in CYBER_ITEM_PATTERNS + ITEM_801_CYBER_PATTERNS)
-    if not has_cyber:
+    lower = text.lower()
+    if not any(n in lower for n in RAW_CYBER_NEEDLES):
+        return None
+    if not any(p.search(lower) for p in ALL_CYBER_PATTERNS):
         return None
 
     # Try to extract just Item 1.05 section
@@ -137,10 +167,13 @@ def save_filing(accession: str, metadata: dict, cyber_text: str):
     """Persist metadata.json and cybersecurity.md for a single filing."""
     folder = OUTPUT_DIR / accession.replace("-", "")
     folder.mkdir(parents=True, exist_ok=True)
-    (folder / "metadata.json").write_text(
+    (folder / "cybersecurity.md").write_text(cyber_text, encoding="utf-8")
+    # write metadata.json last and atomically: it is the accession_exists marker
+    tmp_path = folder / "metadata.json.tmp"
+    tmp_path.write_text(
         json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8"
     )
-    (folder / "cybersecurity.md").write_text(cyber_text, encoding="utf-8")
+    os.replace(tmp_path, folder / "metadata.json")
     print(f"  ✓ Saved {accession}  [{metadata.get('ticker','?')}]  {metadata.get('filing_date','')}")
 
 
@@ -216,7 +249,8 @@ def main():
                 continue
 
             # Determine which item this is
-            item = "1.05" if any(p.search(cyber_text) for p in CYBER_ITEM_PATTERNS) else "8.01"
+            cyber_lower = cyber_text.lower()
+            item = "1.05" if any(p.search(cyber_lower) for p in CYBER_ITEM_PATTERNS) else "8.01"
 
             metadata = build_metadata(sub, document, item)
             try: